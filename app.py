@@ -1,12 +1,31 @@
+import re
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+    from lxml import html as lh
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+import numpy as np
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import time
 
+# Defer copies of filtered frames until mutation (always on from pandas 3)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
 # Page configuration
 st.set_page_config(
     page_title="Laptop Web Scraper",
@@ -15,7 +34,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+_CSS = """
     <style>
     .main-header {
         font-size: 2.5rem;
@@ -31,65 +50,176 @@ st.markdown("""
         box-shadow: 2px 2px 5px rgba(0,0,0,0.1);
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+# Re-sent on every rerun: elements not re-emitted are removed from the page
+st.markdown(_CSS, unsafe_allow_html=True)
+
+# Shared HTTP session, kept across reruns for keep-alive + connection pooling
+@st.cache_resource
+def get_session():
+    """Create the HTTP session shared by all scrapes"""
+    if CachedSession is not None:
+        # Disk-backed HTTP cache; expired pages are revalidated with ETag/Last-Modified
+        session = CachedSession('.http_cache', backend='sqlite', expire_after=3600)
+    else:
+        session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=20))
+    return session
+
+_SESSION = get_session()
+
+# Scraped DataFrame columns
+COLUMNS = ['Name', 'Price', 'Description', 'Rating', 'Reviews']
+SORT_COLUMNS = ['Name', 'Price', 'Rating', 'Reviews']
+
+# Patterns for the price and review count columns
+_PRICE_STRIP_RE = re.compile(r'[$,]')
+_REVIEW_COUNT_RE = re.compile(r'(\d+)')
+
+# XPath fallback used when selectolax is not installed
+def _has_class(cls):
+    return f'contains(concat(" ", normalize-space(@class), " "), " {cls} ")'
+
+_CARD_XPATH = f'//div[{_has_class("card-body")}][.//a[{_has_class("title")}]]'
+_NAME_XPATH = f'string(.//a[{_has_class("title")}]/@title)'
+_PRICE_XPATH = f'normalize-space(.//h4[{_has_class("price")}])'
+_DESC_XPATH = f'normalize-space(.//p[{_has_class("description")}])'
+_RATING_XPATH = 'string(.//p[@data-rating]/@data-rating)'
+_REVIEWS_XPATH = f'normalize-space(.//p[{_has_class("review-count")}])'
 
 # Functions
+def _node_text(node, default):
+    """Return the stripped text of a node, or default if it is missing or empty"""
+    if node is None:
+        return default
+    return node.text(separator=' ', strip=True) or default
+
+def _extract_cards_selectolax(html):
+    """Extract raw card fields with selectolax"""
+    tree = LexborHTMLParser(html)
+    cards = []
+    
+    # Find all laptop cards; cards without a title link are skipped and
+    # missing fields get the same defaults as the lxml parser
+    for product in tree.css('div.card-body'):
+        name_tag = product.css_first('a.title')
+        if name_tag is None:
+            continue
+        
+        rating_tag = product.css_first('p[data-rating]')
+        cards.append((
+            name_tag.attributes.get('title') or 'N/A',
+            _node_text(product.css_first('h4.price'), '$0'),
+            _node_text(product.css_first('p.description'), 'N/A'),
+            (rating_tag.attributes.get('data-rating') if rating_tag is not None else None) or '0',
+            _node_text(product.css_first('p.review-count'), '0 reviews')
+        ))
+    
+    return cards
+
+def _extract_cards_lxml(html):
+    """Extract raw card fields with lxml + XPath"""
+    doc = lh.fromstring(html)
+    return [
+        (
+            product.xpath(_NAME_XPATH) or 'N/A',
+            product.xpath(_PRICE_XPATH) or '$0',
+            product.xpath(_DESC_XPATH) or 'N/A',
+            product.xpath(_RATING_XPATH) or '0',
+            product.xpath(_REVIEWS_XPATH) or '0 reviews'
+        )
+        for product in doc.xpath(_CARD_XPATH)
+    ]
+
+extract_cards = _extract_cards_selectolax if LexborHTMLParser is not None else _extract_cards_lxml
+
+def _page_urls(url, pages):
+    """Build the listing URLs for the first `pages` pages"""
+    sep = '&' if '?' in url else '?'
+    return [url] + [f"{url}{sep}page={n}" for n in range(2, pages + 1)]
+
+def _fetch(url):
+    """Fetch a listing page and return its raw HTML"""
+    response = _SESSION.get(url, timeout=10)
+    response.raise_for_status()
+    return response.content
+
 @st.cache_data(ttl=3600)
-def scrape_laptops(url):
+def fetch_html(url, pages=1):
+    """Fetch the raw HTML of the first `pages` listing pages"""
+    # Fetch all pages concurrently over the shared session
+    urls = _page_urls(url, pages)
+    with ThreadPoolExecutor(max_workers=min(10, len(urls))) as executor:
+        return list(executor.map(_fetch, urls))
+
+@st.cache_data(max_entries=8)
+def parse_html(htmls):
+    """Parse listing pages into the laptop DataFrame"""
+    laptops = []
+    for html in htmls:
+        laptops.extend(extract_cards(html))
+    
+    # Convert the raw text columns in one vectorized pass each; products whose
+    # price or rating does not parse are skipped, as the per-card loop did
+    df = pd.DataFrame.from_records(laptops, columns=COLUMNS)
+    df['Price'] = pd.to_numeric(df['Price'].str.replace(_PRICE_STRIP_RE, '', regex=True), errors='coerce')
+    df['Rating'] = pd.to_numeric(df['Rating'], errors='coerce')
+    df = df[df['Price'].notna() & (df['Rating'] % 1 == 0)].reset_index(drop=True)
+    df['Price'] = df['Price'].astype('float32')
+    df['Rating'] = df['Rating'].astype('int8')
+    df['Reviews'] = df['Reviews'].str.extract(_REVIEW_COUNT_RE, expand=False).fillna('0').astype('int32')
+    
+    # Arrow-backed strings instead of Python object columns
+    df = df.astype({'Name': 'string[pyarrow]', 'Description': 'string[pyarrow]'})
+    
+    # Value score (high rating, low price), computed once per scrape
+    df['Value_Score'] = (df['Rating'].astype('float32') * 100.0) / df['Price']
+    
+    return df
+
+def scrape_laptops(url, pages=1):
     """Scrape laptop data from the website"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        laptops = []
-        
-        # Find all laptop cards
-        products = soup.find_all('div', class_='card-body')
-        
-        for product in products:
-            try:
-                # Extract product name
-                name_tag = product.find('a', class_='title')
-                name = name_tag.get('title', '') if name_tag else 'N/A'
-                
-                # Extract price
-                price_tag = product.find('h4', class_='price')
-                price_text = price_tag.text.strip() if price_tag else '$0'
-                price = float(price_text.replace('$', '').replace(',', ''))
-                
-                # Extract description
-                desc_tag = product.find('p', class_='description')
-                description = desc_tag.text.strip() if desc_tag else 'N/A'
-                
-                # Extract rating
-                rating_tag = product.find('p', {'data-rating': True})
-                rating = int(rating_tag['data-rating']) if rating_tag else 0
-                
-                # Extract number of reviews
-                reviews_tag = product.find('p', class_='review-count')
-                reviews = reviews_tag.text.strip() if reviews_tag else '0 reviews'
-                review_count = int(reviews.split()[0]) if reviews else 0
-                
-                laptops.append({
-                    'Name': name,
-                    'Price': price,
-                    'Description': description,
-                    'Rating': rating,
-                    'Reviews': review_count
-                })
-            except Exception as e:
-                continue
-        
-        return pd.DataFrame(laptops)
+        return parse_html(fetch_html(url, pages))
     
     except Exception as e:
         st.error(f"Error scraping data: {str(e)}")
         return pd.DataFrame()
 
+def sort_indices(df):
+    """Precompute the ascending row order for each sortable column"""
+    return {col: df[col].argsort(kind='stable').to_numpy() for col in SORT_COLUMNS}
+
+def top_n_idx(arr, n):
+    """Return the positions of the n largest values, largest first
+    
+    Matches DataFrame.nlargest(n, keep='first'): ties keep the earliest
+    rows, and NaN rows only fill up the result after all other values.
+    """
+    n = min(n, len(arr))
+    if arr.dtype.kind == 'f':
+        nan_idx = np.flatnonzero(np.isnan(arr))
+        if len(nan_idx):
+            valid_idx = np.flatnonzero(~np.isnan(arr))
+            top = valid_idx[top_n_idx(arr[valid_idx], n)]
+            return np.concatenate([top, nan_idx[:n - len(top)]])
+    if n == 0:
+        return np.arange(0)
+    if n >= len(arr) / 2:
+        return np.argsort(-arr, kind='stable')[:n]
+    
+    # Partial selection is O(N): take every row above the n-th largest
+    # value, then fill up with the earliest rows equal to it
+    kth = -np.partition(-arr, n - 1)[n - 1]
+    above = np.flatnonzero(arr > kth)
+    tied = np.flatnonzero(arr == kth)[:n - len(above)]
+    idx = np.concatenate([above, tied])
+    return idx[np.argsort(-arr[idx], kind='stable')]
+
 def display_metrics(df):
     """Display key metrics"""
     col1, col2, col3, col4 = st.columns(4)
@@ -109,19 +239,27 @@ def display_metrics(df):
         total_reviews = df['Reviews'].sum()
         st.metric("Total Reviews", f"{total_reviews:,}")
 
+@st.cache_data(max_entries=32)
 def create_price_distribution(df):
     """Create price distribution chart"""
-    fig = px.histogram(
-        df, 
-        x='Price', 
-        nbins=20,
+    counts, edges = np.histogram(df['Price'].to_numpy(), bins=20)
+    fig = go.Figure(data=[
+        go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+            marker_color='#1f77b4'
+        )
+    ])
+    fig.update_layout(
         title='Price Distribution',
-        labels={'Price': 'Price ($)', 'count': 'Number of Products'},
-        color_discrete_sequence=['#1f77b4']
+        xaxis_title='Price ($)',
+        yaxis_title='Number of Products',
+        showlegend=False
     )
-    fig.update_layout(showlegend=False)
     return fig
 
+@st.cache_data(max_entries=32)
 def create_rating_distribution(df):
     """Create rating distribution chart"""
     rating_counts = df['Rating'].value_counts().sort_index()
@@ -142,21 +280,51 @@ def create_rating_distribution(df):
     )
     return fig
 
+@st.cache_data(max_entries=32)
 def create_price_vs_rating(df):
     """Create scatter plot of price vs rating"""
-    fig = px.scatter(
-        df,
-        x='Rating',
-        y='Price',
-        size='Reviews',
-        hover_data=['Name'],
+    rating = df['Rating'].to_numpy()
+    reviews = df['Reviews'].to_numpy()
+    fig = go.Figure(data=[
+        go.Scatter(
+            x=rating,
+            y=df['Price'].to_numpy(),
+            mode='markers',
+            text=df['Name'].to_numpy(),
+            customdata=reviews,
+            marker=dict(
+                size=reviews,
+                sizemode='area',
+                sizeref=2.0 * max(int(reviews.max(initial=0)), 1) / 20 ** 2,
+                color=rating,
+                colorscale='Viridis',
+                showscale=True,
+                colorbar=dict(title='Rating')
+            ),
+            hovertemplate='%{text}<br>Rating: %{x}<br>Price: $%{y:.2f}<br>Reviews: %{customdata}<extra></extra>'
+        )
+    ])
+    fig.update_layout(
         title='Price vs Rating',
-        labels={'Rating': 'Rating (Stars)', 'Price': 'Price ($)'},
-        color='Rating',
-        color_continuous_scale='Viridis'
+        xaxis_title='Rating (Stars)',
+        yaxis_title='Price ($)'
     )
     return fig
 
+@st.cache_data(max_entries=32)
+def to_csv_bytes(df):
+    """Serialize the data to CSV bytes for download"""
+    return df.to_csv(index=False).encode('utf-8')
+
+@st.cache_data(max_entries=32)
+def to_json_bytes(df):
+    """Serialize the data to JSON bytes for download"""
+    # Widen float32 columns before rounding so no float32 noise is serialized
+    df = df.astype({'Price': 'float64', 'Value_Score': 'float64'}).round({'Price': 2, 'Value_Score': 4})
+    if orjson is None:
+        return df.to_json(orient='records', indent=2).encode('utf-8')
+    return orjson.dumps(df.to_dict(orient='records'), option=orjson.OPT_INDENT_2)
+
 # Main App
 def main():
     st.markdown('<p class="main-header">💻 Laptop Web Scraper Dashboard</p>', unsafe_allow_html=True)
@@ -167,11 +335,14 @@ def main():
         "Website URL",
         "https://webscraper.io/test-sites/e-commerce/static/computers/laptops"  
     )
+    pages = st.sidebar.number_input("Pages to scrape", min_value=1, max_value=20, value=1)
     
     # Scrape button
     if st.sidebar.button("🔄 Scrape Data", type="primary"):
         with st.spinner("Scraping data... Please wait..."):
-            st.session_state['df'] = scrape_laptops(url)
+            df = scrape_laptops(url, int(pages))
+            st.session_state['df'] = df
+            st.session_state['sort_idx'] = sort_indices(df) if not df.empty else {}
             st.session_state['scrape_time'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     # Check if data exists
@@ -201,12 +372,15 @@ def main():
         default=sorted(df['Rating'].unique())
     )
     
-    # Apply filters
-    filtered_df = df[
-        (df['Price'] >= price_range[0]) &
-        (df['Price'] <= price_range[1]) &
-        (df['Rating'].isin(rating_filter))
-    ]
+    # Apply filters as a single boolean mask over the raw arrays
+    price = df['Price'].to_numpy()
+    rating = df['Rating'].to_numpy()
+    allowed = np.zeros(max(int(rating.max()), 5) + 1, dtype=bool)
+    allowed[np.asarray(rating_filter, dtype=np.intp)] = True
+    mask = price >= price_range[0]
+    mask &= price <= price_range[1]
+    mask &= allowed[rating]
+    filtered_df = df.iloc[mask]
     
     # Display metrics
     st.header("📊 Key Metrics")
@@ -229,7 +403,7 @@ def main():
         with col1:
             sort_by = st.selectbox(
                 "Sort by",
-                ["Name", "Price", "Rating", "Reviews"]
+                SORT_COLUMNS
             )
         with col2:
             sort_order = st.radio(
@@ -238,10 +412,12 @@ def main():
                 horizontal=True
             )
         
-        sorted_df = filtered_df.sort_values(
-            by=sort_by,
-            ascending=(sort_order == "Ascending")
-        )
+        # Reuse the row order computed at scrape time, keeping filtered rows
+        order = st.session_state['sort_idx'][sort_by]
+        order = order[mask[order]]
+        if sort_order == "Descending":
+            order = order[::-1]
+        sorted_df = df[COLUMNS].iloc[order]
         
         st.dataframe(
             sorted_df,
@@ -276,17 +452,18 @@ def main():
         
         top_n = st.slider("Select number of top products", 5, 20, 10)
         
-        top_rated = filtered_df.nlargest(top_n, 'Rating')
+        top_rated = filtered_df.iloc[top_n_idx(filtered_df['Rating'].to_numpy(), top_n)]
+        top_rated = top_rated[['Rating', 'Name', 'Price', 'Description', 'Reviews']]
         
-        for idx, row in top_rated.iterrows():
-            with st.expander(f"⭐ {row['Rating']} - {row['Name']}"):
+        for rating, name, price, description, reviews in top_rated.itertuples(index=False, name=None):
+            with st.expander(f"⭐ {rating} - {name}"):
                 col1, col2 = st.columns([2, 1])
                 with col1:
-                    st.write(f"**Description:** {row['Description']}")
-                    st.write(f"**Reviews:** {row['Reviews']}")
+                    st.write(f"**Description:** {description}")
+                    st.write(f"**Reviews:** {reviews}")
                 with col2:
-                    st.metric("Price", f"${row['Price']:.2f}")
-                    st.metric("Rating", f"{row['Rating']} ⭐")
+                    st.metric("Price", f"${price:.2f}")
+                    st.metric("Rating", f"{rating} ⭐")
     
     with tab4:
         st.header("💰 Price Analysis")
@@ -309,12 +486,11 @@ def main():
         
         with col2:
             st.subheader("Most Expensive Laptops")
-            top_expensive = filtered_df.nlargest(5, 'Price')[['Name', 'Price', 'Rating']]
+            top_expensive = filtered_df.iloc[top_n_idx(filtered_df['Price'].to_numpy(), 5)][['Name', 'Price', 'Rating']]
             st.dataframe(top_expensive, hide_index=True, use_container_width=True)
         
         st.subheader("Best Value (High Rating, Low Price)")
-        filtered_df['Value_Score'] = filtered_df['Rating'] / (filtered_df['Price'] / 100)
-        best_value = filtered_df.nlargest(10, 'Value_Score')[['Name', 'Price', 'Rating', 'Reviews']]
+        best_value = filtered_df.iloc[top_n_idx(filtered_df['Value_Score'].to_numpy(), 10)][['Name', 'Price', 'Rating', 'Reviews']]
         st.dataframe(best_value, hide_index=True, use_container_width=True)
     
     with tab5:
@@ -324,7 +500,7 @@ def main():
         
         with col1:
             st.subheader("Export as CSV")
-            csv = filtered_df.to_csv(index=False).encode('utf-8')
+            csv = to_csv_bytes(filtered_df)
             st.download_button(
                 label="📄 Download CSV",
                 data=csv,
@@ -335,7 +511,7 @@ def main():
         
         with col2:
             st.subheader("Export as JSON")
-            json_data = filtered_df.to_json(orient='records', indent=2)
+            json_data = to_json_bytes(filtered_df)
             st.download_button(
                 label="📋 Download JSON",
                 data=json_data,